@@ -2,8 +2,15 @@
 # Titan-X Core API – v1
 # Clean production-ready entrypoint
 
+import logging
+import logging.handlers
+import os
+import queue
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 # Import ONLY the Titan Core v1 router
 from routes.core_v1 import router as core_v1_router
@@ -11,6 +18,37 @@ from routes.support_v1 import router as support_v1_router
 from routes.marketing_v1 import router as marketing_v1_router
 
 
+# -----------------------------------------------------
+# Logging (request handlers enqueue, a background thread writes)
+# -----------------------------------------------------
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(logging.Formatter("[TITAN-CORE] %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler)
+
+_log_handler = logging.handlers.QueueHandler(_log_queue)
+
+_titan_logger = logging.getLogger("titan")
+_titan_logger.setLevel(logging.INFO)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # The handler is only attached while the listener drains the queue, so
+    # a module imported twice (python main_v1.py) or an app that never runs
+    # its lifespan can't leave an undrained queue on the shared logger.
+    _titan_logger.addHandler(_log_handler)
+    _titan_logger.propagate = False
+    _log_listener.start()
+    try:
+        yield
+    finally:
+        _log_listener.stop()
+        _titan_logger.removeHandler(_log_handler)
+        _titan_logger.propagate = True
+
+
 # -----------------------------------------------------
 # Create FastAPI app
 # -----------------------------------------------------
@@ -18,6 +56,8 @@ app = FastAPI(
     title="Titan-X Core API",
     version="1.0.0",
     description="Titan-X Core behavioural engine (HALO v1). Clean, stable v1 API surface.",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -52,3 +92,23 @@ async def root():
         "status": "running",
         "docs": "/docs",
     }
+
+
+# -----------------------------------------------------
+# Local runner (uvloop + httptools where installed)
+# -----------------------------------------------------
+if __name__ == "__main__":
+    import uvicorn
+
+    # "auto" picks uvloop/httptools when installed (uvloop is not on Windows)
+    # and falls back to asyncio/h11 otherwise.
+    # HALO session state is in-process, so keep a single worker unless
+    # requests are routed to workers by session_id.
+    uvicorn.run(
+        "main_v1:app",
+        host=os.environ.get("TITAN_HOST", "127.0.0.1"),
+        port=int(os.environ.get("TITAN_PORT", "8000")),
+        loop="auto",
+        http="auto",
+        workers=int(os.environ.get("TITAN_WORKERS", "1")),
+    )
@@ -2,24 +2,34 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Optional, Any, Dict, List
-
-from fastapi import APIRouter
-from pydantic import BaseModel
-import statistics
-import math
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Annotated, Optional, Any, Dict, List
+import logging
+import os
+import threading
+
+import orjson
+from fastapi import APIRouter, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, Field
 import time
 
+from routes.core_v1_kernels import accumulate, signal_array
+
 
 router = APIRouter(
     prefix="",
     tags=["core-v1"],
+    default_response_class=ORJSONResponse,
 )
 
 
 API_VERSION = "1.0.0"
 
+# Shared empty payload; responses are serialised and dropped, never mutated.
+_EMPTY: Dict[str, Any] = {}
+
 
 # =====================================================
 # Titan Response Format v1 (TRF-1)
@@ -32,124 +42,177 @@ def trf(
     event: Optional[str] = None,
     data: Optional[Dict[str, Any]] = None,
     msg: Optional[str] = None,
+    _time=time.time,
+    _ver=API_VERSION,
 ):
     """Standardised response format for Titan Core v1."""
+    # Not pooled: FastAPI encodes the returned dict after the handler exits,
+    # so recycling ``data``/``meta`` in a ``finally`` would race the encoder.
     return {
         "ok": ok,
         "session_id": session_id,
         "event": event,
-        "data": data or {},
+        "data": data if data is not None else _EMPTY,
         "msg": msg,
-        "meta": {
-            "version": API_VERSION,
-            "timestamp": time.time(),
-        },
+        "meta": {"version": _ver, "timestamp": _time()},
     }
 
 
+def _prebuilt_trf(**kwargs) -> bytes:
+    """Serialise a static TRF envelope up to the ``meta.timestamp`` value.
+
+    ``timestamp`` is the last key of ``meta``, which is the last key of the
+    envelope, so a response body is this prefix + timestamp + ``}}``.
+    """
+    body = trf(**kwargs)
+    del body["meta"]["timestamp"]
+    return orjson.dumps(body)[:-2] + b',"timestamp":'
+
+
+def _static_response(prefix: bytes, _time=time.time) -> Response:
+    return Response(
+        content=b"".join((prefix, repr(_time()).encode(), b"}}")),
+        media_type="application/json",
+    )
+
+
 # =====================================================
 # Logging Layer v1 (safe, lightweight)
 # =====================================================
 
-def log(msg: str):
-    """Simple safe logger."""
-    print(f"[TITAN-CORE] {msg}")
+# Handlers only enqueue records; I/O happens on the QueueListener thread
+# configured in main_v1.
+_log = logging.getLogger("titan.core")
 
 
 # =====================================================
 # Validation Layer v1
 # =====================================================
 
-def validate_session_id(session_id: Optional[str]):
-    if session_id is None or not isinstance(session_id, str) or session_id.strip() == "":
-        return "Invalid session_id: must be a non-empty string."
-    return None
-
-
-def validate_event_type(event_type: Optional[str]):
-    if event_type is None or not isinstance(event_type, str) or event_type.strip() == "":
-        return "Invalid event_type: must be a non-empty string."
-    return None
+def _not_blank(value: str) -> str:
+    if not value.strip():
+        raise ValueError("must be a non-empty string")
+    return value
 
 
-def validate_timestamp(timestamp: Any):
-    if not isinstance(timestamp, (int, float)):
-        return "Invalid timestamp: must be a number."
-    if timestamp < 0:
-        return "Invalid timestamp: must be >= 0."
-    if math.isnan(timestamp) or math.isinf(timestamp):
-        return "Invalid timestamp: must be a finite number."
-    return None
-
-
-def validate_signal(name: str, value: Any):
-    """Validate simple HALO float inputs."""
-    if value is None:
-        return None  # Optional field
-    if not isinstance(value, (int, float)):
-        return f"Invalid {name}: must be a number."
-    if value < 0:
-        return f"Invalid {name}: must be >= 0."
-    if math.isnan(value) or math.isinf(value):
-        return f"Invalid {name}: must be a finite number."
-    return None
+# Empty strings are rejected by pydantic-core; only whitespace-only values
+# reach the Python check.
+NonEmptyStr = Annotated[str, Field(min_length=1), AfterValidator(_not_blank)]
 
 
 # =====================================================
 # Internal HALO Engine (low-resolution v1)
 # =====================================================
 
-@dataclass
+@dataclass(slots=True)
 class HaloSessionState:
     session_id: str
     event_count: int = 0
-    friction_values: List[float] = field(default_factory=list)
-    hesitation_values: List[float] = field(default_factory=list)
-    pace_values: List[float] = field(default_factory=list)
+    # Running sums/counts keep each session fixed-size and O(1) per event.
+    friction_sum: float = 0.0
+    friction_n: int = 0
+    hesitation_sum: float = 0.0
+    hesitation_n: int = 0
+    pace_sum: float = 0.0
+    pace_n: int = 0
 
     def record(self, friction, hesitation, pace):
         self.event_count += 1
 
         if friction is not None:
-            self.friction_values.append(friction)
+            self.friction_sum += friction
+            self.friction_n += 1
         if hesitation is not None:
-            self.hesitation_values.append(hesitation)
+            self.hesitation_sum += hesitation
+            self.hesitation_n += 1
         if pace is not None:
-            self.pace_values.append(pace)
+            self.pace_sum += pace
+            self.pace_n += 1
+
+    def merge(self, count, friction_sum, friction_n, hesitation_sum, hesitation_n, pace_sum, pace_n):
+        """Fold pre-aggregated sums from a batch into this session."""
+        self.event_count += count
+        self.friction_sum += friction_sum
+        self.friction_n += friction_n
+        self.hesitation_sum += hesitation_sum
+        self.hesitation_n += hesitation_n
+        self.pace_sum += pace_sum
+        self.pace_n += pace_n
 
     def summary(self) -> Dict[str, Optional[float]]:
         return {
             "events_count": self.event_count,
-            "average_friction": statistics.mean(self.friction_values) if self.friction_values else None,
-            "average_hesitation": statistics.mean(self.hesitation_values) if self.hesitation_values else None,
-            "average_pace": statistics.mean(self.pace_values) if self.pace_values else None,
+            "average_friction": self.friction_sum / self.friction_n if self.friction_n else None,
+            "average_hesitation": self.hesitation_sum / self.hesitation_n if self.hesitation_n else None,
+            "average_pace": self.pace_sum / self.pace_n if self.pace_n else None,
         }
 
 
+# Sessions are locked by shard so concurrent events on different
+# sessions don't contend on a single engine-wide lock.
+_N_SHARDS = 32
+_SHARD_LOCKS = [threading.Lock() for _ in range(_N_SHARDS)]
+
+
+def _lock_for(session_id: str) -> threading.Lock:
+    return _SHARD_LOCKS[hash(session_id) % _N_SHARDS]
+
+
 class HaloEngine:
-    def __init__(self):
-        self.sessions: Dict[str, HaloSessionState] = {}
+    def __init__(self, max_sessions: int = 100_000):
+        # LRU order: oldest first. Sessions beyond max_sessions are evicted.
+        self.sessions: OrderedDict[str, HaloSessionState] = OrderedDict()
+        self.max_sessions = max_sessions
+        # Guards only the O(1) ordering/eviction ops shared across shards.
+        self._order_lock = threading.Lock()
+
+    def _touch(self, session_id: str) -> HaloSessionState:
+        with self._order_lock:
+            state = self.sessions.get(session_id)
+            if state is not None:
+                self.sessions.move_to_end(session_id)
+                return state
+
+            state = self.sessions[session_id] = HaloSessionState(session_id=session_id)
+            if len(self.sessions) > self.max_sessions:
+                self.sessions.popitem(last=False)
+            return state
 
     def start(self, session_id: str):
-        if session_id not in self.sessions:
-            self.sessions[session_id] = HaloSessionState(session_id=session_id)
+        with _lock_for(session_id):
+            self._touch(session_id)
 
     def record_event(self, session_id, friction, hesitation, pace):
-        if session_id not in self.sessions:
-            self.start(session_id)
+        with _lock_for(session_id):
+            state = self._touch(session_id)
+            state.record(friction, hesitation, pace)
+
+            return state.summary()
 
-        state = self.sessions[session_id]
-        state.record(friction, hesitation, pace)
+    def record_batch(self, session_id, friction, hesitation, pace):
+        """Record many events at once; signals are float arrays with NaN for missing."""
+        sums = accumulate(friction, hesitation, pace)
+        with _lock_for(session_id):
+            state = self._touch(session_id)
+            state.merge(len(friction), *sums)
 
-        return state.summary()
+            return state.summary()
 
     def end(self, session_id):
-        if session_id not in self.sessions:
-            return None
-        return self.sessions[session_id].summary()
+        with _lock_for(session_id):
+            state = self.sessions.get(session_id)
+            return None if state is None else state.summary()
 
 
-halo_engine = HaloEngine()
+# Independent engines, one per CPU, so sessions on different shards never
+# share a dict or an LRU lock. The session cap is split evenly between them.
+_MAX_SESSIONS = 100_000
+_N_ENGINES = max(1, os.cpu_count() or 1)
+_ENGINES = [HaloEngine(max_sessions=max(1, _MAX_SESSIONS // _N_ENGINES)) for _ in range(_N_ENGINES)]
+
+
+def _engine(session_id: str) -> HaloEngine:
+    return _ENGINES[hash(session_id) % _N_ENGINES]
 
 
 # =====================================================
@@ -157,7 +220,7 @@ halo_engine = HaloEngine()
 # =====================================================
 
 class StartSessionRequest(BaseModel):
-    session_id: str
+    session_id: NonEmptyStr
     user_id: Optional[str] = None
     metadata: Optional[Dict[str, Any]] = None
 
@@ -168,18 +231,32 @@ class EventContext(BaseModel):
     extra: Optional[Dict[str, Any]] = None
 
 
-class EventRequest(BaseModel):
-    session_id: str
-    event_type: str
-    timestamp: float
-    friction: Optional[float] = None
-    hesitation: Optional[float] = None
-    pace: Optional[float] = None
+class BatchEvent(BaseModel):
+    event_type: NonEmptyStr
+    # Rejected with 422 by pydantic-core before the handler runs.
+    timestamp: float = Field(ge=0, allow_inf_nan=False)
+    friction: Optional[float] = Field(default=None, ge=0, allow_inf_nan=False)
+    hesitation: Optional[float] = Field(default=None, ge=0, allow_inf_nan=False)
+    pace: Optional[float] = Field(default=None, ge=0, allow_inf_nan=False)
     context: Optional[EventContext] = None
 
 
+class EventRequest(BatchEvent):
+    session_id: NonEmptyStr
+
+
+# Bounds the per-request signal arrays and the time one batch holds a
+# session's shard lock.
+_MAX_BATCH_EVENTS = 10_000
+
+
+class EventBatchRequest(BaseModel):
+    session_id: NonEmptyStr
+    events: List[BatchEvent] = Field(min_length=1, max_length=_MAX_BATCH_EVENTS)
+
+
 class EndSessionRequest(BaseModel):
-    session_id: str
+    session_id: NonEmptyStr
     metadata: Optional[Dict[str, Any]] = None
     include_summary: bool = True
 
@@ -188,32 +265,33 @@ class EndSessionRequest(BaseModel):
 # Core Endpoints (TRF-1 + Validation + Logging)
 # =====================================================
 
+# Static bodies for the probe endpoints; only the timestamp is live.
+_HEALTH_PREFIX = _prebuilt_trf(msg="ok")
+_STATUS_PREFIX = _prebuilt_trf(
+    data={
+        "service": "titan-x-core",
+        "version": API_VERSION,
+        "mode": "dev",
+    }
+)
+
+
 @router.get("/health", operation_id="healthcheck_v1")
 async def health():
-    return trf(msg="ok")
+    return _static_response(_HEALTH_PREFIX)
 
 
 @router.get("/status", operation_id="status_v1")
 async def status():
-    return trf(
-        data={
-            "service": "titan-x-core",
-            "version": API_VERSION,
-            "mode": "dev",
-        }
-    )
+    return _static_response(_STATUS_PREFIX)
 
 
 @router.post("/v1/start", operation_id="start_session_v1")
 async def start_session(payload: StartSessionRequest):
 
-    err = validate_session_id(payload.session_id)
-    if err:
-        return trf(ok=False, msg=err)
+    _engine(payload.session_id).start(payload.session_id)
 
-    halo_engine.start(payload.session_id)
-
-    log(f"Session started: {payload.session_id}")
+    _log.info("Session started: %s", payload.session_id)
 
     return trf(
         session_id=payload.session_id,
@@ -225,24 +303,17 @@ async def start_session(payload: StartSessionRequest):
 @router.post("/v1/event", operation_id="record_event_v1")
 async def record_event(payload: EventRequest):
 
-    err = validate_session_id(payload.session_id) \
-        or validate_event_type(payload.event_type) \
-        or validate_timestamp(payload.timestamp) \
-        or validate_signal("friction", payload.friction) \
-        or validate_signal("hesitation", payload.hesitation) \
-        or validate_signal("pace", payload.pace)
-
-    if err:
-        return trf(ok=False, session_id=payload.session_id, event=payload.event_type, msg=err)
-
-    rolling = halo_engine.record_event(
+    rolling = _engine(payload.session_id).record_event(
         session_id=payload.session_id,
         friction=payload.friction,
         hesitation=payload.hesitation,
         pace=payload.pace,
     )
 
-    log(f"Event: {payload.event_type} | Session: {payload.session_id} | Count: {rolling['events_count']}")
+    _log.info(
+        "Event: %s | Session: %s | Count: %s",
+        payload.event_type, payload.session_id, rolling["events_count"],
+    )
 
     return trf(
         session_id=payload.session_id,
@@ -251,19 +322,40 @@ async def record_event(payload: EventRequest):
     )
 
 
+@router.post("/v1/event/batch", operation_id="record_event_batch_v1")
+async def record_event_batch(payload: EventBatchRequest):
+
+    events = payload.events
+    n = len(events)
+
+    rolling = _engine(payload.session_id).record_batch(
+        session_id=payload.session_id,
+        friction=signal_array((e.friction for e in events), n),
+        hesitation=signal_array((e.hesitation for e in events), n),
+        pace=signal_array((e.pace for e in events), n),
+    )
+
+    _log.info(
+        "Batch: %s events | Session: %s | Count: %s",
+        n, payload.session_id, rolling["events_count"],
+    )
+
+    return trf(
+        session_id=payload.session_id,
+        event="events_batch_recorded",
+        data=rolling,
+    )
+
+
 @router.post("/v1/end", operation_id="end_session_v1")
 async def end_session(payload: EndSessionRequest):
 
-    err = validate_session_id(payload.session_id)
-    if err:
-        return trf(ok=False, msg=err)
-
-    summary = halo_engine.end(payload.session_id)
+    summary = _engine(payload.session_id).end(payload.session_id)
 
     if summary is None:
         return trf(ok=False, session_id=payload.session_id, msg="Session not found.")
 
-    log(f"Session ended: {payload.session_id} | Total events: {summary['events_count']}")
+    _log.info("Session ended: %s | Total events: %s", payload.session_id, summary["events_count"])
 
     if not payload.include_summary:
         return trf(session_id=payload.session_id, event="session_ended")
@@ -0,0 +1,74 @@
+# routes/core_v1_kernels.py
+# Numeric kernels for bulk HALO ingest (/v1/event/batch).
+#
+# Missing signals are encoded as NaN in the input arrays. Numba is optional:
+# when it is not installed the NumPy implementation is used instead.
+
+from __future__ import annotations
+
+import math
+from typing import Iterable, Optional, Tuple
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - optional dependency
+    numba = None
+
+
+_NAN = math.nan
+
+
+def signal_array(values: Iterable[Optional[float]], n: int) -> np.ndarray:
+    """Pack ``n`` optional signal values into a float64 array (None -> NaN)."""
+    return np.fromiter((_NAN if v is None else v for v in values), np.float64, n)
+
+
+def _accumulate_numpy(
+    friction: np.ndarray,
+    hesitation: np.ndarray,
+    pace: np.ndarray,
+) -> Tuple[float, int, float, int, float, int]:
+    return (
+        float(np.nansum(friction)), int(np.count_nonzero(~np.isnan(friction))),
+        float(np.nansum(hesitation)), int(np.count_nonzero(~np.isnan(hesitation))),
+        float(np.nansum(pace)), int(np.count_nonzero(~np.isnan(pace))),
+    )
+
+
+if numba is not None:
+
+    # No fastmath: it assumes NaN never occurs, and NaN marks missing values.
+    @numba.njit(cache=True, nogil=True)
+    def _accumulate_numba(friction, hesitation, pace):
+        f_sum = 0.0
+        h_sum = 0.0
+        p_sum = 0.0
+        f_n = 0
+        h_n = 0
+        p_n = 0
+        for i in range(friction.shape[0]):
+            v = friction[i]
+            if v == v:
+                f_sum += v
+                f_n += 1
+            v = hesitation[i]
+            if v == v:
+                h_sum += v
+                h_n += 1
+            v = pace[i]
+            if v == v:
+                p_sum += v
+                p_n += 1
+        return f_sum, f_n, h_sum, h_n, p_sum, p_n
+
+    accumulate = _accumulate_numba
+
+    # Compile at import so the first /v1/event/batch request doesn't block
+    # the event loop on JIT compilation.
+    _empty = np.zeros(0, dtype=np.float64)
+    accumulate(_empty, _empty, _empty)
+    del _empty
+else:
+    accumulate = _accumulate_numpy
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import functools
 import time
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 from fastapi import APIRouter
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel, Field
 
 
@@ -12,6 +14,7 @@ API_VERSION = "1.0.0"
 router = APIRouter(
     prefix="",
     tags=["marketing-v1"],
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -20,21 +23,26 @@ router = APIRouter(
 # --------------------------------------------------------------------
 
 
+_EMPTY: Dict[str, Any] = {}
+
+
 def make_response(
     *,
     ok: bool,
     event: Optional[str],
     data: Optional[Dict[str, Any]] = None,
     msg: Optional[str] = None,
+    _time=time.time,
+    _ver=API_VERSION,
 ) -> Dict[str, Any]:
     return {
         "ok": ok,
         "event": event,
-        "data": data or {},
+        "data": data if data is not None else _EMPTY,
         "msg": msg,
         "meta": {
-            "version": API_VERSION,
-            "timestamp": time.time(),
+            "version": _ver,
+            "timestamp": _time(),
             "source": "titan-core-marketing-v1",
         },
     }
@@ -68,6 +76,16 @@ SUPPORTED_AUDIENCES = {
 }
 
 
+# Error messages are built once; only the offending value is formatted in.
+_USE_CASES_STR = ", ".join(sorted(SUPPORTED_USE_CASES))
+_TONES_STR = ", ".join(sorted(SUPPORTED_TONES))
+_AUDIENCES_STR = ", ".join(sorted(SUPPORTED_AUDIENCES))
+
+_USE_CASE_ERR = f"Unsupported use_case '{{}}'. Supported: {_USE_CASES_STR}."
+_AUDIENCE_ERR = f"Unsupported audience '{{}}'. Supported: {_AUDIENCES_STR}."
+_TONE_ERR = f"Unsupported tone '{{}}'. Supported: {_TONES_STR}."
+
+
 def _base_product_name(product_name: Optional[str]) -> str:
     return product_name or "Titan-Core"
 
@@ -162,67 +180,104 @@ def _email_invite(product_name: str, audience: str, tone: str) -> str:
     return body
 
 
-def generate_marketing_copy(
-    *,
+def _default_primary(product_name: str, audience: str, tone: str) -> str:
+    return (
+        f"{product_name} is a lightweight behavioural engine. "
+        "Use it to track friction, hesitation and pace per session."
+    )
+
+
+_PRIMARY_DISPATCH = {
+    "landing_headline": _landing_headline,
+    "feature_blurb": _feature_blurb,
+    "dev_portal_intro": lambda pn, a, t: _dev_portal_intro(pn, t),
+    "changelog_snippet": lambda pn, a, t: _changelog_snippet(pn),
+    "email_invite": _email_invite,
+}
+
+
+# Variants: simple deterministic rephrases
+_VARIANT_DISPATCH = {
+    "landing_headline": lambda pn: [
+        f"Add behavioural intelligence to your product with {pn}.",
+        f"{pn} helps you see where users slow down, hesitate and drop off.",
+    ],
+    "feature_blurb": lambda pn: [
+        "Capture a few numeric signals per event and get back rolling metrics you can plug into experiments.",
+    ],
+    "dev_portal_intro": lambda pn: [
+        f"{pn} focuses on a small, predictable API surface so you can integrate it quickly.",
+    ],
+    "changelog_snippet": lambda pn: [
+        "Introduced a dedicated behavioural engine service, keeping core product logic separate from telemetry.",
+    ],
+    "email_invite": lambda pn: [
+        "I can share a quick Postman collection if you’d like to see how it works in practice.",
+    ],
+}
+
+
+def _no_variants(product_name: str) -> List[str]:
+    return []
+
+
+# Custom product names are untrusted and unbounded; only short ones are
+# cached, so the LRU can't pin large names (and the copy built from them).
+_CACHEABLE_NAME_MAX_LEN = 128
+
+
+@functools.lru_cache(maxsize=1024)
+def _gen_cached(
     use_case: str,
     audience: str,
     tone: str,
-    product_name: Optional[str],
-) -> Dict[str, Any]:
-    product_name = _base_product_name(product_name)
+    product_name: str,
+) -> Tuple[str, Tuple[str, ...]]:
+    # Pure function of its inputs; returns immutables so cached results
+    # can be shared between requests.
+    primary = _PRIMARY_DISPATCH.get(use_case, _default_primary)(product_name, audience, tone)
+    variants = _VARIANT_DISPATCH.get(use_case, _no_variants)(product_name)
+    return primary, tuple(variants)
 
-    primary: str
 
-    if use_case == "landing_headline":
-        primary = _landing_headline(product_name, audience, tone)
-    elif use_case == "feature_blurb":
-        primary = _feature_blurb(product_name, audience, tone)
-    elif use_case == "dev_portal_intro":
-        primary = _dev_portal_intro(product_name, tone)
-    elif use_case == "changelog_snippet":
-        primary = _changelog_snippet(product_name)
-    elif use_case == "email_invite":
-        primary = _email_invite(product_name, audience, tone)
-    else:
-        primary = (
-            f"{product_name} is a lightweight behavioural engine. "
-            "Use it to track friction, hesitation and pace per session."
-        )
+_DEFAULT_PRODUCT_NAME = _base_product_name(None)
 
-    # Variants: simple deterministic rephrases
-    variants: List[str] = []
 
-    if use_case == "landing_headline":
-        variants.append(
-            f"Add behavioural intelligence to your product with {product_name}."
-        )
-        variants.append(
-            f"{product_name} helps you see where users slow down, hesitate and drop off."
+def _build_table() -> Dict[Tuple[str, str, str], Tuple[str, Tuple[str, ...]]]:
+    return {
+        (use_case, audience, tone): _gen_cached.__wrapped__(
+            use_case, audience, tone, _DEFAULT_PRODUCT_NAME
         )
+        for use_case in SUPPORTED_USE_CASES
+        for audience in SUPPORTED_AUDIENCES
+        for tone in SUPPORTED_TONES
+    }
 
-    if use_case == "feature_blurb":
-        variants.append(
-            "Capture a few numeric signals per event and get back rolling metrics you can plug into experiments."
-        )
 
-    if use_case == "dev_portal_intro":
-        variants.append(
-            f"{product_name} focuses on a small, predictable API surface so you can integrate it quickly."
-        )
+# Every supported combination for the default product name, built at import.
+_PRECOMPUTED = _build_table()
 
-    if use_case == "changelog_snippet":
-        variants.append(
-            "Introduced a dedicated behavioural engine service, keeping core product logic separate from telemetry."
-        )
 
-    if use_case == "email_invite":
-        variants.append(
-            "I can share a quick Postman collection if you’d like to see how it works in practice."
-        )
+def generate_marketing_copy(
+    *,
+    use_case: str,
+    audience: str,
+    tone: str,
+    product_name: Optional[str],
+) -> Dict[str, Any]:
+    product_name = _base_product_name(product_name)
+
+    hit = None
+    if product_name == _DEFAULT_PRODUCT_NAME:
+        hit = _PRECOMPUTED.get((use_case, audience, tone))
+    if hit is None:
+        gen = _gen_cached if len(product_name) <= _CACHEABLE_NAME_MAX_LEN else _gen_cached.__wrapped__
+        hit = gen(use_case, audience, tone, product_name)
+    primary, variants = hit
 
     return {
         "primary": primary,
-        "variants": variants,
+        "variants": list(variants),
         "use_case": use_case,
         "audience": audience,
         "tone": tone,
@@ -238,15 +293,15 @@ def generate_marketing_copy(
 class MarketingRequest(BaseModel):
     use_case: str = Field(
         ...,
-        description=f"One of: {', '.join(sorted(SUPPORTED_USE_CASES))}",
+        description=f"One of: {_USE_CASES_STR}",
     )
     audience: str = Field(
         ...,
-        description=f"One of: {', '.join(sorted(SUPPORTED_AUDIENCES))}",
+        description=f"One of: {_AUDIENCES_STR}",
     )
     tone: str = Field(
         default="neutral",
-        description=f"One of: {', '.join(sorted(SUPPORTED_TONES))}",
+        description=f"One of: {_TONES_STR}",
     )
     product_name: Optional[str] = Field(
         default=None,
@@ -258,6 +313,8 @@ class MarketingRequest(BaseModel):
     )
 
 
+# Documents the shape of ``data`` on success; the endpoint returns the
+# generated dict directly rather than validating its own output.
 class MarketingCopy(BaseModel):
     primary: str
     variants: List[str]
@@ -281,10 +338,7 @@ async def generate_marketing(payload: MarketingRequest) -> Dict[str, Any]:
         return make_response(
             ok=False,
             event="marketing_error",
-            msg=(
-                f"Unsupported use_case '{payload.use_case}'. "
-                f"Supported: {', '.join(sorted(SUPPORTED_USE_CASES))}."
-            ),
+            msg=_USE_CASE_ERR.format(payload.use_case),
             data={},
         )
 
@@ -292,10 +346,7 @@ async def generate_marketing(payload: MarketingRequest) -> Dict[str, Any]:
         return make_response(
             ok=False,
             event="marketing_error",
-            msg=(
-                f"Unsupported audience '{payload.audience}'. "
-                f"Supported: {', '.join(sorted(SUPPORTED_AUDIENCES))}."
-            ),
+            msg=_AUDIENCE_ERR.format(payload.audience),
             data={},
         )
 
@@ -303,10 +354,7 @@ async def generate_marketing(payload: MarketingRequest) -> Dict[str, Any]:
         return make_response(
             ok=False,
             event="marketing_error",
-            msg=(
-                f"Unsupported tone '{payload.tone}'. "
-                f"Supported: {', '.join(sorted(SUPPORTED_TONES))}."
-            ),
+            msg=_TONE_ERR.format(payload.tone),
             data={},
         )
 
@@ -320,11 +368,9 @@ async def generate_marketing(payload: MarketingRequest) -> Dict[str, Any]:
     if not payload.include_variants:
         raw["variants"] = []
 
-    mc = MarketingCopy(**raw)
-
     return make_response(
         ok=True,
         event="marketing_copy",
-        data=mc.dict(),
+        data=raw,
         msg=None,
     )